@@ -1,3 +1,5 @@
+import argparse
+import importlib.util
 import logging
 import os
 import sys
@@ -6,85 +8,334 @@ from typing import Optional, Dict, Any, List
 from pathlib import Path
 import time
 import threading
-
-# Add the parent directory to Python path to allow direct imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import re
+import sched
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+# Relative imports from the scripts package
+from .utils.json_utils import dumps
+from .utils.notifications import NotificationManager
+from .utils.duration import parse_iso_duration, format_duration
+from .utils.aws_utils import get_cached_account_alias, get_cached_permission_set_details
+from .utils.slack_messages import create_access_revoked_blocks
+from .utils.webhook_handler import WebhookHandler
+from .utils.async_webhook import track
 
 logger = logging.getLogger(__name__)
 
-try:
-    import boto3
-except ImportError as e:
-    logger.error(f"Failed to import boto3: {str(e)}")
-    print(json.dumps({
-        "status": "error",
-        "error_type": "ImportError",
-        "message": "Required package boto3 is not installed - please ignore this during discovery"
-    }))
-    pass
-
-try:
-    from jinja2 import Template, Environment, FileSystemLoader
-except ImportError as e:
-    logger.error(f"Failed to import jinja2: {str(e)}")
-    print(json.dumps({
-        "status": "error",
-        "error_type": "ImportError",
-        "message": "Required package jinja2 is not installed - please ignore this during discovery"
-    }))
-    pass
-
-try:
-    import argparse
-except ImportError as e:
-    logger.error(f"Failed to import argparse: {str(e)}")
-    print(json.dumps({
-        "status": "error",
-        "error_type": "ImportError",
-        "message": "Required package argparse is not installed - please ignore this during discovery"
-    }))
-    pass
-
-# Direct imports from the scripts directory
-from scripts.utils.notifications import NotificationManager
-from scripts.utils.aws_utils import get_account_alias, get_permission_set_details
-from scripts.utils.slack_messages import create_access_revoked_blocks
-from scripts.utils.webhook_handler import WebhookHandler
+# Check optional packages without importing them; boto3 is only imported once a handler is created
+for _module in ('boto3', 'jinja2'):
+    if importlib.util.find_spec(_module) is None:
+        logger.error(f"Failed to import {_module}: No module named '{_module}'")
+        print(dumps({
+            "status": "error",
+            "error_type": "ImportError",
+            "message": f"Required package {_module} is not installed - please ignore this during discovery"
+        }))
 
 def print_progress(message: str, emoji: str) -> None:
     """Print progress messages with emoji."""
     print(f"\n{emoji} {message}", flush=True)
-    sys.stdout.flush()
-
-def format_duration(seconds: int) -> str:
-    """Format duration in seconds to a human-readable string."""
-    if seconds >= 3600:
-        hours = seconds / 3600
-        return f"{hours:.1f} hours"
-    elif seconds >= 60:
-        minutes = seconds / 60
-        return f"{int(minutes)} minutes"
-    else:
-        return f"{seconds} seconds"
+
+# Delay before the first retry of a failed revocation webhook, doubled on each further attempt
+_REVOCATION_RETRY_DELAY = 60
+# Attempts after which a revocation webhook is given up on and moved to a .failed file
+_REVOCATION_MAX_ATTEMPTS = 8
+# Age after which another process's unfinished claim on an entry is taken back
+_REVOCATION_CLAIM_TIMEOUT = 300
+
+def _is_retryable(status: Optional[int]) -> bool:
+    """Whether a failed webhook response may succeed if sent again."""
+    # No status means the request itself failed (e.g. connection refused or timeout)
+    return status is None or status >= 500 or status in (408, 429)
+
+class _Scheduler:
+    """Single-thread scheduler for delayed revocation webhooks.
+
+    Pending revocations are queued on a sched.scheduler and persisted to disk
+    so they survive process restarts. Each entry is its own file in a private
+    directory, written atomically, so concurrent processes never overwrite
+    each other's entries. A process claims an entry by renaming its file
+    before firing it, so an entry loaded by several processes is sent once,
+    and only deletes it once delivery succeeds (at-least-once delivery).
+    Failures that may be transient are retried with exponential backoff up to
+    _REVOCATION_MAX_ATTEMPTS times; other failures, and entries out of
+    attempts, are moved to a .failed file and logged.
+    Entries hold the complete webhook request (URL and body) built when the
+    revocation was scheduled, so replaying an entry never depends on the
+    environment of the process that fires it.
+    If the directory can't be created, or an entry can't be written, the
+    entry is kept in memory only and is lost if the process exits first.
+    One daemon thread runs the queue and fires the callback with the stored
+    request. The callback must not block on network I/O and returns a future
+    resolving to the response status code (None if the request failed), or
+    None if the webhook couldn't be sent at all.
+    """
+
+    def __init__(self, callback, state_dir: Optional[Path]):
+        self._callback = callback
+        self._state_dir = state_dir
+        if self._state_dir is not None:
+            try:
+                self._state_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            except OSError as e:
+                # Revocations must still be scheduled, so run without persistence instead of failing
+                logger.error(f"Failed to create {self._state_dir}, pending revocations won't survive restarts: {e}")
+                self._state_dir = None
+        self._cond = threading.Condition()
+        self._wakeup = False
+        self._sched = sched.scheduler(time.time, self._delay)
+        self._load()
+        # Fire anything already overdue right away so short-lived runs still deliver it
+        self._sched.run(blocking=False)
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def schedule(self, deadline: float, request: Dict[str, Any]) -> None:
+        """Schedule a revocation webhook request to be sent at the given unix timestamp."""
+        entry_id = uuid.uuid4().hex
+        entry = {"deadline": deadline, "request": request, "attempts": 0}
+        self._enter(entry_id, entry, self._write_entry(entry_id, entry))
+
+    def _enter(self, entry_id: str, entry: Dict[str, Any], persisted: bool) -> None:
+        self._sched.enterabs(entry['deadline'], 1, self._fire, argument=(entry_id, entry, persisted))
+        with self._cond:
+            # Wake the worker so it re-checks the queue head
+            self._wakeup = True
+            self._cond.notify()
+
+    def _delay(self, seconds: float) -> None:
+        # Used by sched in place of time.sleep so new, earlier deadlines interrupt the wait
+        with self._cond:
+            if not self._wakeup:
+                self._cond.wait(timeout=seconds)
+            self._wakeup = False
+
+    def _run(self) -> None:
+        while True:
+            # sched.run returns once the queue drains, so wait for new work and restart it
+            with self._cond:
+                while self._sched.empty():
+                    self._cond.wait()
+                self._wakeup = False
+            self._sched.run()
+
+    def _fire(self, entry_id: str, entry: Dict[str, Any], persisted: bool) -> None:
+        if persisted:
+            claimed_path = self._claimed_path(entry_id)
+            try:
+                os.rename(self._entry_path(entry_id), claimed_path)
+                # Stamp the claim time so a claim abandoned by a crashed process can be recovered
+                os.utime(claimed_path)
+            except FileNotFoundError:
+                # Already claimed by another process that loaded the same entry
+                return
+            except OSError as e:
+                # Still send it; the entry stays on disk and a later run sends it again
+                logger.error(f"Failed to claim pending revocation {entry_id}: {e}")
+                persisted = False
+
+        # Resolved once the outcome is recorded on disk; tracked so process exit waits for it
+        settled: Future = Future()
+        track(settled)
+        try:
+            delivery = self._callback(entry['request'])
+        except Exception as e:
+            logger.error(f"Failed to send scheduled revocation webhook: {e}")
+            delivery = None
+
+        if delivery is None:
+            self._settle(entry_id, entry, persisted, "it could not be sent", False, settled)
+        else:
+            delivery.add_done_callback(
+                lambda future: self._settle_response(entry_id, entry, persisted, future, settled)
+            )
+
+    def _settle_response(self, entry_id: str, entry: Dict[str, Any], persisted: bool,
+                         delivery: Future, settled: Future) -> None:
+        status = None if delivery.exception() else delivery.result()
+        if status is not None and status < 400:
+            self._settle(entry_id, entry, persisted, None, False, settled)
+        else:
+            error = f"HTTP {status}" if status is not None else "the request failed"
+            self._settle(entry_id, entry, persisted, error, _is_retryable(status), settled)
+
+    def _settle(self, entry_id: str, entry: Dict[str, Any], persisted: bool,
+                error: Optional[str], retryable: bool, settled: Future) -> None:
+        # The entry only leaves disk once delivery succeeds or it is moved aside as failed
+        try:
+            if error is not None:
+                attempts = entry['attempts'] + 1
+                if retryable and attempts < _REVOCATION_MAX_ATTEMPTS:
+                    delay = _REVOCATION_RETRY_DELAY * 2 ** (attempts - 1)
+                    logger.warning(f"Revocation webhook delivery failed ({error}), "
+                                   f"retrying in {delay}s (attempt {attempts} of {_REVOCATION_MAX_ATTEMPTS})")
+                    entry = {**entry, "deadline": time.time() + delay, "attempts": attempts}
+                    self._enter(entry_id, entry, self._write_entry(entry_id, entry))
+                else:
+                    reason = f"{error} after {attempts} attempt(s)" if retryable else error
+                    self._dead_letter(entry_id, {**entry, "attempts": attempts, "error": reason})
+            if persisted:
+                self._claimed_path(entry_id).unlink(missing_ok=True)
+        finally:
+            settled.set_result(error is None)
+
+    def _dead_letter(self, entry_id: str, entry: Dict[str, Any]) -> None:
+        if self._state_dir is not None and self._write_entry(entry_id, entry, self._failed_path(entry_id)):
+            logger.error(f"Giving up on revocation webhook, {entry['error']}; kept in {self._failed_path(entry_id)}")
+        else:
+            # Nowhere to keep it, so log the request itself for manual follow-up
+            logger.error(f"Giving up on revocation webhook, {entry['error']}: {dumps(entry['request'])}")
+
+    def _entry_path(self, entry_id: str) -> Path:
+        return self._state_dir / f"{entry_id}.json"
+
+    def _claimed_path(self, entry_id: str) -> Path:
+        return self._state_dir / f"{entry_id}.inflight"
+
+    def _failed_path(self, entry_id: str) -> Path:
+        return self._state_dir / f"{entry_id}.failed"
+
+    def _write_entry(self, entry_id: str, entry: Dict[str, Any], path: Optional[Path] = None) -> bool:
+        # Write to a private temp file and rename it into place, so a crash never leaves a partial entry
+        if self._state_dir is None:
+            return False
+        tmp_path = self._state_dir / f"{entry_id}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                f.write(dumps(entry))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path or self._entry_path(entry_id))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to persist pending revocation to {self._state_dir}: {e}")
+            return False
+
+    def _load(self) -> None:
+        if self._state_dir is None:
+            return
+
+        # Put back claims whose process died before recording the outcome
+        for claimed_path in self._state_dir.glob('*.inflight'):
+            try:
+                if time.time() - claimed_path.stat().st_mtime > _REVOCATION_CLAIM_TIMEOUT:
+                    os.rename(claimed_path, self._entry_path(claimed_path.stem))
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.error(f"Failed to recover pending revocation from {claimed_path}: {e}")
+
+        for entry_path in self._state_dir.glob('*.json'):
+            try:
+                entry = json.loads(entry_path.read_text())
+                entry = {"deadline": entry['deadline'], "request": entry['request'],
+                         "attempts": entry.get('attempts', 0)}
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                # Set unreadable entries aside so they aren't retried on every run
+                logger.error(f"Failed to load pending revocation from {entry_path}: {e}")
+                try:
+                    os.rename(entry_path, self._failed_path(entry_path.stem))
+                except OSError:
+                    pass
+                continue
+            self._sched.enterabs(entry['deadline'], 1, self._fire, argument=(entry_path.stem, entry, True))
+
+_scheduler: Optional[_Scheduler] = None
+_scheduler_lock = threading.Lock()
+
+def _get_scheduler(callback) -> _Scheduler:
+    """Return the process-wide revocation scheduler, starting it on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            try:
+                state_dir = Path(os.environ.get('REVOCATION_SCHEDULE_DIR') or
+                                 Path.home() / '.aws_jit_tools' / 'pending_revocations')
+            except Exception as e:
+                logger.error(f"Failed to resolve the pending revocations directory: {e}")
+                state_dir = None
+            _scheduler = _Scheduler(callback, state_dir)
+        return _scheduler
+
+# Sessions, clients and SSO instance metadata shared by every handler, keyed by profile
+_CLIENTS: Dict[Optional[str], Dict[str, Any]] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def _get_clients(profile_name: Optional[str] = None) -> Dict[str, Any]:
+    """Return the shared boto3 session, clients and SSO instance details for a profile."""
+    clients = _CLIENTS.get(profile_name)
+    if clients is not None:
+        return clients
+
+    with _CLIENTS_LOCK:
+        clients = _CLIENTS.get(profile_name)
+        if clients is not None:
+            return clients
+
+        import boto3
+        from botocore.config import Config
+
+        # A larger pool lets the parallel lookups run without queueing on connections
+        config = Config(max_pool_connections=50, retries={'mode': 'adaptive'})
+        session = boto3.Session(profile_name=profile_name)
+        sso_admin = session.client('sso-admin', config=config)
+
+        print_progress("Fetching SSO instance details...", "🔍")
+        instances = sso_admin.list_instances()['Instances']
+        if not instances:
+            raise ValueError("No SSO instance found")
+
+        clients = {
+            'session': session,
+            'identitystore': session.client('identitystore', config=config),
+            'sso_admin': sso_admin,
+            'iam_client': session.client('iam', config=config),
+            'instance_arn': instances[0]['InstanceArn'],
+            'identity_store_id': instances[0]['IdentityStoreId'],
+        }
+        _CLIENTS[profile_name] = clients
+        return clients
+
+# IAM user lookups keyed by (profile, email), cached briefly to collapse repeat lookups within a burst
+_IAM_USER_CACHE_TTL = 60
+_iam_user_cache: Dict[tuple, tuple] = {}
+
+def _get_cached_iam_user(cache_key: tuple) -> Optional[Dict[str, Any]]:
+    """Return a cached IAM user that is still fresh, dropping expired entries."""
+    now = time.time()
+    for key in [key for key, (cached_at, _) in list(_iam_user_cache.items())
+                if now - cached_at >= _IAM_USER_CACHE_TTL]:
+        _iam_user_cache.pop(key, None)
+    cached = _iam_user_cache.get(cache_key)
+    return cached[1] if cached else None
+
+# Valid IAM user names, see https://docs.aws.amazon.com/IAM/latest/APIReference/API_GetUser.html
+_IAM_USER_NAME_RE = re.compile(r'[\w+=,.@-]{1,64}', re.ASCII)
 
 class AWSAccessHandler:
     def __init__(self, profile_name: Optional[str] = None):
         """Initialize AWS access handler."""
         try:
             print_progress("Initializing AWS handler...", "🔄")
-            self.session = boto3.Session(profile_name=profile_name)
-            self.identitystore = self.session.client('identitystore')
-            self.sso_admin = self.session.client('sso-admin')
+            self.profile_name = profile_name
+            clients = _get_clients(profile_name)
+            self.session = clients['session']
+            self.identitystore = clients['identitystore']
+            self.sso_admin = clients['sso_admin']
+            self.iam_client = clients['iam_client']
+            self.instance_arn = clients['instance_arn']
+            self.identity_store_id = clients['identity_store_id']
             self.notifications = NotificationManager()
             self.webhook_handler = WebhookHandler()
-            self.iam_client = self.session.client('iam')
-            
-            print_progress("Fetching SSO instance details...", "🔍")
-            instances = self.sso_admin.list_instances()['Instances']
-            if not instances:
-                raise ValueError("No SSO instance found")
-            self.instance_arn = instances[0]['InstanceArn']
-            self.identity_store_id = instances[0]['IdentityStoreId']
+            if self.webhook_handler.webhook_url:
+                # Start the scheduler now so revocations persisted by earlier runs are replayed
+                _get_scheduler(self.webhook_handler.post_revocation_request)
+            self._ps_arn_cache: Dict[tuple, str] = {}
             print_progress("AWS handler initialized successfully", "✅")
             
         except Exception as e:
@@ -92,19 +343,7 @@ class AWSAccessHandler:
 
     def parse_iso8601_duration(self, duration: str) -> int:
         """Convert ISO8601 duration to seconds."""
-        try:
-            if duration.startswith('PT'):
-                value = int(duration[2:-1])
-                unit = duration[-1]
-                if unit == 'H':
-                    return value * 3600
-                elif unit == 'M':
-                    return value * 60
-                elif unit == 'S':
-                    return value
-            return 3600  # Default 1 hour
-        except Exception:
-            return 3600
+        return parse_iso_duration(duration)
 
     def validate_duration(self, requested_duration: str, max_duration: str) -> str:
         """Validate that requested duration doesn't exceed maximum duration."""
@@ -135,31 +374,55 @@ class AWSAccessHandler:
                             'AttributeValue': email
                         }]
                     )
+                except (self.identitystore.exceptions.ResourceNotFoundException,
+                        self.identitystore.exceptions.AccessDeniedException,
+                        self.identitystore.exceptions.ValidationException) as e:
+                    # Identity Center can't answer for this user (e.g. IAM-only roles for S3 access),
+                    # so fall through to IAM. Throttling that outlasts the client retries still raises.
+                    logger.debug(f"Identity Center lookup failed: {e}")
+                else:
                     users = response.get('Users', [])
                     if users:
                         print_progress(f"Found user in Identity Center: {users[0].get('UserName')}", "✅")
                         return users[0]
-                except Exception as e:
-                    logger.debug(f"Identity Center lookup failed: {e}")
+                    if os.environ.get('AWS_SSO_AUTHORITATIVE') == '1':
+                        print_progress(f"No user found with email: {email}", "❌")
+                        return None
 
             # If not found in Identity Center or if SSO is not configured, try IAM
+            email_key = email.lower()
+            # IAM clients are per profile, so a user cached for one account must not answer for another
+            cache_key = (self.profile_name, email_key)
+            user = _get_cached_iam_user(cache_key)
+            if user is not None:
+                print_progress(f"Found user in IAM: {user['UserName']}", "✅")
+                return user
+
             try:
-                paginator = self.iam_client.get_paginator('list_users')
-                for page in paginator.paginate():
-                    for user in page['Users']:
-                        if user['UserName'].lower() == email.lower():
+                # Common case: the IAM user name is the email itself. Emails that can't be
+                # a user name would only raise a ValidationError, so go straight to the scan.
+                if _IAM_USER_NAME_RE.fullmatch(email):
+                    try:
+                        user = self.iam_client.get_user(UserName=email)['User']
+                        print_progress(f"Found user in IAM: {user['UserName']}", "✅")
+                        _iam_user_cache[cache_key] = (time.time(), user)
+                        return user
+                    except self.iam_client.exceptions.NoSuchEntityException:
+                        pass
+
+                # Users and their tags come back together, so no per-user tag calls are needed
+                paginator = self.iam_client.get_paginator('get_account_authorization_details')
+                for page in paginator.paginate(Filter=['User']):
+                    for user in page['UserDetailList']:
+                        if user['UserName'].lower() == email_key:
                             print_progress(f"Found user in IAM: {user['UserName']}", "✅")
+                            _iam_user_cache[cache_key] = (time.time(), user)
                             return user
-                        
-                        try:
-                            tags_response = self.iam_client.list_user_tags(UserName=user['UserName'])
-                            for tag in tags_response['Tags']:
-                                if tag['Key'].lower() == 'email' and tag['Value'].lower() == email.lower():
-                                    print_progress(f"Found user in IAM by email tag: {user['UserName']}", "✅")
-                                    return user
-                        except Exception as e:
-                            logger.debug(f"Failed to get tags for user {user['UserName']}: {e}")
-                            continue
+                        for tag in user.get('Tags', []):
+                            if tag['Key'].lower() == 'email' and tag['Value'].lower() == email_key:
+                                print_progress(f"Found user in IAM by email tag: {user['UserName']}", "✅")
+                                _iam_user_cache[cache_key] = (time.time(), user)
+                                return user
 
             except Exception as e:
                 logger.error(f"IAM user lookup failed: {e}")
@@ -173,19 +436,32 @@ class AWSAccessHandler:
 
     def get_permission_set_arn(self, permission_set_name: str) -> Optional[str]:
         """Get Permission Set ARN from its name."""
+        cache_key = (self.instance_arn, permission_set_name)
+        if cache_key in self._ps_arn_cache:
+            return self._ps_arn_cache[cache_key]
+
         try:
             print_progress(f"Looking up permission set: {permission_set_name}", "🔑")
             paginator = self.sso_admin.get_paginator('list_permission_sets')
-            
-            for page in paginator.paginate(InstanceArn=self.instance_arn):
-                for permission_set_arn in page['PermissionSets']:
-                    response = self.sso_admin.describe_permission_set(
-                        InstanceArn=self.instance_arn,
-                        PermissionSetArn=permission_set_arn
-                    )
-                    if response['PermissionSet']['Name'] == permission_set_name:
+            permission_set_arns = list(
+                paginator.paginate(InstanceArn=self.instance_arn).search('PermissionSets[]')
+            )
+
+            def describe(permission_set_arn: str) -> Dict[str, Any]:
+                return self.sso_admin.describe_permission_set(
+                    InstanceArn=self.instance_arn,
+                    PermissionSetArn=permission_set_arn
+                )['PermissionSet']
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = {executor.submit(describe, arn): arn for arn in permission_set_arns}
+                for future in as_completed(futures):
+                    if future.result()['Name'] == permission_set_name:
+                        for pending in futures:
+                            pending.cancel()
                         print_progress(f"Found permission set: {permission_set_name}", "✅")
-                        return permission_set_arn
+                        self._ps_arn_cache[cache_key] = futures[future]
+                        return futures[future]
             
             print_progress(f"No permission set found with name: {permission_set_name}", "❌")
             return None
@@ -215,8 +491,8 @@ class AWSAccessHandler:
                 raise ValueError(f"Permission set not found: {permission_set_name}")
             
             # Get account alias and permission set details for better display
-            account_alias = get_account_alias(self.session) or os.environ['AWS_ACCOUNT_ID']
-            permission_set_details = get_permission_set_details(
+            account_alias = get_cached_account_alias(self.session, os.environ['AWS_ACCOUNT_ID']) or os.environ['AWS_ACCOUNT_ID']
+            permission_set_details = get_cached_permission_set_details(
                 self.session, 
                 self.instance_arn, 
                 permission_set_arn
@@ -336,26 +612,26 @@ class AWSAccessHandler:
                                    policy_details: Optional[Dict[str, Any]] = None,
                                    buckets: Optional[list] = None):
         """Schedule the revocation webhook after the TTL expires."""
-        def send_webhook():
-            if not os.environ.get('REVOKATION_WEBHOOK_URL'):
-                print("No revocation webhook URL configured, skipping webhook...")
-                return
-            
-            time.sleep(duration_seconds)
-            access_type = "s3" if buckets else "sso"
-            self.webhook_handler.send_revocation_webhook(
-                user_email=user_email,
-                access_type=access_type,
-                policy_details=policy_details or {},
-                duration_seconds=duration_seconds,
-                account_id=account_id,
-                permission_set=permission_set,
-                buckets=buckets
-            )
-
-        webhook_thread = threading.Thread(target=send_webhook)
-        webhook_thread.daemon = True
-        webhook_thread.start()
+        if not os.environ.get('REVOKATION_WEBHOOK_URL'):
+            print("No revocation webhook URL configured, skipping webhook...")
+            return
+
+        # Build the request now, while this tool's environment decides its URL and tool name
+        request = self.webhook_handler.build_revocation_request(
+            user_email=user_email,
+            access_type="s3" if buckets else "sso",
+            policy_details=policy_details or {},
+            duration_seconds=duration_seconds,
+            account_id=account_id,
+            permission_set=permission_set,
+            buckets=buckets
+        )
+        if request is None:
+            print_progress("Failed to build revocation webhook, not scheduling it", "⚠️")
+            return
+
+        scheduler = _get_scheduler(self.webhook_handler.post_revocation_request)
+        scheduler.schedule(time.time() + duration_seconds, request)
 
     def revoke_access(self, user_email: str, permission_set_name: str):
         """Revoke access for a user by email and permission set name."""
@@ -465,7 +741,7 @@ class AWSAccessHandler:
                 policy['Statement'] = [stmt for stmt in policy['Statement'] if stmt.get('Sid') != statement_id]
 
             # Update the bucket policy
-            s3.put_bucket_policy(Bucket=bucket_name, Policy=json.dumps(policy))
+            s3.put_bucket_policy(Bucket=bucket_name, Policy=dumps(policy))
             return True
 
         except Exception as e:
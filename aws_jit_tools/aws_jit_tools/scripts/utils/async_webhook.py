@@ -0,0 +1,110 @@
+import asyncio
+import atexit
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional, Set, Tuple
+from .json_utils import dumps
+
+logger = logging.getLogger(__name__)
+
+# Try to import aiohttp, but fall back to requests if it's not available
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError as e:
+    logger.debug(f"Failed to import aiohttp: {str(e)}")
+    AIOHTTP_AVAILABLE = False
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_session: Optional['aiohttp.ClientSession'] = None
+_fallback_executor: Optional[ThreadPoolExecutor] = None
+_pending: Set[Future] = set()
+_lock = threading.Lock()
+
+# How long to wait for in-flight requests at exit before closing the session
+SHUTDOWN_TIMEOUT = 15
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True).start()
+        return _loop
+
+def _get_fallback_executor() -> ThreadPoolExecutor:
+    global _fallback_executor
+    with _lock:
+        if _fallback_executor is None:
+            _fallback_executor = ThreadPoolExecutor(max_workers=4)
+        return _fallback_executor
+
+async def _post(url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: float) -> Tuple[int, str]:
+    global _session
+    # Only ever touched from the loop thread, so no locking is needed here
+    if _session is None:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+            json_serialize=dumps
+        )
+    async with _session.post(url, json=payload, headers=headers,
+                             timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        return response.status, await response.text()
+
+async def _close_session() -> None:
+    if _session is not None:
+        await _session.close()
+
+def track(future: Future) -> None:
+    """Hold process exit until the future completes, up to SHUTDOWN_TIMEOUT."""
+    with _lock:
+        _pending.add(future)
+    future.add_done_callback(_untrack)
+
+def _untrack(future: Future) -> None:
+    with _lock:
+        _pending.discard(future)
+
+def _shutdown() -> None:
+    """Wait for in-flight requests, then close the shared session on exit."""
+    with _lock:
+        pending = list(_pending)
+    if pending:
+        _, not_done = wait(pending, timeout=SHUTDOWN_TIMEOUT)
+        if not_done:
+            logger.warning(f"{len(not_done)} webhook request(s) still in flight at exit")
+
+    if _loop is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_close_session(), _loop).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Failed to close webhook session: {str(e)}")
+
+atexit.register(_shutdown)
+
+def _post_sync(url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: float) -> Tuple[int, str]:
+    import requests
+    headers = {'Content-Type': 'application/json', **headers}
+    response = requests.post(url, data=dumps(payload).encode(), headers=headers, timeout=timeout)
+    return response.status_code, response.text
+
+def post_json(url: str, payload: Dict[str, Any],
+              headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> 'Future[Tuple[int, str]]':
+    """POST a JSON payload without blocking the caller.
+
+    Requests share a single aiohttp session on one background event loop, so
+    keep-alive connections are reused across webhooks. Without aiohttp the
+    request is sent with requests on a small thread pool instead.
+
+    Returns:
+        Future resolving to the response status code and body
+    """
+    headers = headers or {}
+    if AIOHTTP_AVAILABLE:
+        future = asyncio.run_coroutine_threadsafe(_post(url, payload, headers, timeout), _get_loop())
+    else:
+        future = _get_fallback_executor().submit(_post_sync, url, payload, headers, timeout)
+    track(future)
+    return future
@@ -1,4 +1,4 @@
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, Union, TYPE_CHECKING
 import logging
 from dataclasses import dataclass
 
@@ -14,9 +14,8 @@ else:
 
 logger = logging.getLogger(__name__)
 
-# Try to import boto3, but don't fail if it's not available
+# Only the botocore exceptions are needed at runtime; the session is passed in by the caller
 try:
-    import boto3
     from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
     BOTO3_AVAILABLE = True
 except ImportError as e:
@@ -100,4 +99,46 @@ def get_permission_set_details(
         raise
     except Exception as e:
         logger.error(f"Unexpected error getting permission set details: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+# Account aliases and permission set details don't change during a run, so
+# results are cached by their stable identifiers rather than by session.
+_account_alias_cache: Dict[str, Optional[str]] = {}
+_permission_set_details_cache: Dict[Tuple[str, str], dict] = {}
+
+def get_cached_account_alias(session: 'Optional[boto3.Session]', account_id: str) -> Optional[str]:
+    """Get AWS account alias, reusing any earlier lookup for the same account.
+    
+    Args:
+        session: boto3 Session object
+        account_id: AWS account ID used as the cache key
+        
+    Returns:
+        str: Account alias if found, None otherwise
+    """
+    if account_id not in _account_alias_cache:
+        _account_alias_cache[account_id] = get_account_alias(session)
+    return _account_alias_cache[account_id]
+
+def get_cached_permission_set_details(
+    session: 'Optional[boto3.Session]',
+    instance_arn: str,
+    permission_set_arn: str
+) -> Optional[dict]:
+    """Get permission set details, reusing any earlier lookup for the same permission set.
+    
+    Args:
+        session: boto3 Session object
+        instance_arn: SSO instance ARN
+        permission_set_arn: Permission set ARN
+        
+    Returns:
+        dict: Permission set details if found, None otherwise
+    """
+    key = (instance_arn, permission_set_arn)
+    if key not in _permission_set_details_cache:
+        details = get_permission_set_details(session, instance_arn, permission_set_arn)
+        if details is None:
+            return None
+        _permission_set_details_cache[key] = details
+    return _permission_set_details_cache[key]
@@ -0,0 +1,43 @@
+import functools
+
+# Seconds per unit, keyed by unit; units must appear in this order (H, M, S)
+_ISO_UNITS = {'H': (0, 3600), 'M': (1, 60), 'S': (2, 1)}
+
+def parse_iso_duration(duration: str) -> int:
+    """Convert an ISO8601 time duration (e.g. PT1H30M) to seconds.
+
+    Accepts PT followed by any of H, M and S in that order, each at most once.
+    Falls back to 1 hour for anything that isn't a well-formed PT duration.
+    """
+    if duration[:2] != 'PT':
+        return 3600
+    total = 0
+    acc = 0
+    digits = False
+    last_rank = -1
+    for ch in duration[2:]:
+        if '0' <= ch <= '9':
+            acc = acc * 10 + (ord(ch) - 48)
+            digits = True
+        elif digits and ch in _ISO_UNITS and _ISO_UNITS[ch][0] > last_rank:
+            last_rank, unit_seconds = _ISO_UNITS[ch]
+            total += acc * unit_seconds
+            acc = 0
+            digits = False
+        else:
+            return 3600
+    if digits or len(duration) == 2:
+        return 3600
+    return total
+
+@functools.lru_cache(maxsize=128)
+def format_duration(seconds: int) -> str:
+    """Format duration in seconds to a human-readable string."""
+    if seconds >= 3600:
+        hours = seconds / 3600
+        return f"{hours:.1f} hours"
+    elif seconds >= 60:
+        minutes = seconds / 60
+        return f"{int(minutes)} minutes"
+    else:
+        return f"{seconds} seconds"
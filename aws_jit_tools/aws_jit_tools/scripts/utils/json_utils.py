@@ -0,0 +1,26 @@
+import json
+import logging
+from datetime import date, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Try to import orjson, but fall back to the standard library if it's not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError as e:
+    logger.debug(f"Failed to import orjson: {str(e)}")
+    ORJSON_AVAILABLE = False
+
+def _default(obj: Any) -> str:
+    # Same ISO 8601 form orjson uses for datetimes (e.g. CreatedDate from describe_permission_set)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, default=_default)
@@ -2,6 +2,7 @@ import os
 import logging
 import requests
 from typing import Optional, Dict, Any
+from .json_utils import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +33,11 @@ class SlackClient:
 
             response = requests.post(
                 'https://slack.com/api/chat.postMessage',
-                headers={'Authorization': f'Bearer {self.token}'},
-                json=payload
+                headers={
+                    'Authorization': f'Bearer {self.token}',
+                    'Content-Type': 'application/json; charset=utf-8'
+                },
+                data=dumps(payload).encode()
             )
 
             if not response.ok:
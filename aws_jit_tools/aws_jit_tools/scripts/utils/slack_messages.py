@@ -1,18 +1,117 @@
 from typing import Dict, Any, Optional
 import json
+from .duration import format_duration
 
-def format_duration(seconds: int) -> str:
-    """
-    Format duration in seconds to a human-readable string
-    """
-    if seconds >= 3600:
-        hours = seconds / 3600
-        return f"{hours:.1f} hours"
-    elif seconds >= 60:
-        minutes = seconds / 60
-        return f"{int(minutes)} minutes"
-    else:
-        return f"{seconds} seconds"
+# Static blocks are built once at import time and shared between messages.
+# They are only ever serialized, never mutated.
+_DIVIDER = {"type": "divider"}
+
+_GRANTED_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🎉 AWS Access Granted! 🎉",
+        "emoji": True
+    }
+}
+
+_HOW_TO_ACCESS = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*How to Access AWS:*"
+    }
+}
+
+_SDK_INSTRUCTIONS = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*🔧 AWS SDK Configuration (Python)*\n```python\nimport boto3\nsession = boto3.Session()\ns3 = session.client('s3')\n# The session will use your SSO credentials automatically```"
+    }
+}
+
+_EXPIRED_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "⚠️ AWS Access Expired",
+        "emoji": True
+    }
+}
+
+_EXTEND_ACCESS = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "Need to extend your access? Use the Kubiya JIT access tool to request new credentials."
+    }
+}
+
+_REVOKED_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🔒 AWS Access Revoked",
+        "emoji": True
+    }
+}
+
+_CONTACT_SECURITY = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "If you believe this is a mistake, please contact the security team."
+    }
+}
+
+_S3_GRANTED_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🎉 S3 Access Granted! 🎉",
+        "emoji": True
+    }
+}
+
+_S3_HOW_TO_ACCESS = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*How to Access the S3 Bucket:*\nYou can use your AWS credentials to access the bucket via AWS CLI, SDKs, or the AWS Console."
+    }
+}
+
+_S3_SECURITY_REMINDER = {
+    "type": "context",
+    "elements": [
+        {"type": "mrkdwn", "text": "⚠️ Remember to adhere to data security policies while accessing S3 resources."}
+    ]
+}
+
+_S3_REVOKED_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🔒 S3 Access Revoked",
+        "emoji": True
+    }
+}
+
+# Text templates for the variable parts of each message
+_GRANTED_SUMMARY_FMT = "You've been granted access to AWS account *{account_name}* ({account_id}) with permission set *{permission_set}*"
+_CONSOLE_INSTRUCTIONS_FMT = "*🌐 Web Console Access*\n1. Visit: <https://signin.aws.amazon.com/switchrole?account={account_id}|AWS Console>\n2. Sign in with your SSO credentials\n3. Select account *{account_name}* ({account_id})\n4. You should now have access with the *{permission_set}* permission set"
+_CLI_INSTRUCTIONS_FMT = "*💻 AWS CLI Access*\n1. Configure AWS CLI SSO:\n```aws configure sso\nSSO start URL: https://YOUR_SSO_URL\nSSO Region: YOUR_SSO_REGION\nAccount ID: {account_id}\nRole name: {permission_set}\nCLI profile name: [choose-a-name]```\n2. Login and get credentials:\n```aws sso login```\n3. Test your access:\n```aws sts get-caller-identity```"
+_EXPIRED_FMT = "Your access to AWS account *{account_id}* with permission set *{permission_set}* has expired."
+_REVOKED_FMT = "Your access to AWS account *{account_id}* with permission set *{permission_set}* has been revoked."
+_S3_GRANTED_FMT = "You've been granted *{policy_template}* access to S3 bucket *{bucket_name}*."
+_S3_REVOKED_FMT = "Your access to S3 bucket *{bucket_name}* has been revoked."
+
+def _mrkdwn(text: str) -> Dict[str, Any]:
+    return {"type": "mrkdwn", "text": text}
+
+def _section(text: str) -> Dict[str, Any]:
+    return {"type": "section", "text": _mrkdwn(text)}
 
 def create_access_granted_blocks(account_id: str, permission_set: str, duration_seconds: int, 
                                user_email: str, account_alias: Optional[str] = None,
@@ -23,32 +122,15 @@ def create_access_granted_blocks(account_id: str, permission_set: str, duration_
     account_name = account_alias or account_id
     
     blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "🎉 AWS Access Granted! 🎉",
-                "emoji": True
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"You've been granted access to AWS account *{account_name}* ({account_id}) with permission set *{permission_set}*"
-            }
-        },
+        _GRANTED_HEADER,
+        _section(_GRANTED_SUMMARY_FMT.format(
+            account_name=account_name, account_id=account_id, permission_set=permission_set
+        )),
         {
             "type": "section",
             "fields": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"*Duration:*\n{duration_display}"
-                },
-                {
-                    "type": "mrkdwn",
-                    "text": f"*User:*\n{user_email}"
-                }
+                _mrkdwn(f"*Duration:*\n{duration_display}"),
+                _mrkdwn(f"*User:*\n{user_email}")
             ]
         }
     ]
@@ -56,55 +138,20 @@ def create_access_granted_blocks(account_id: str, permission_set: str, duration_
     # Add permission set details if available
     if permission_set_details:
         description = permission_set_details.get('Description', 'No description available')
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Permission Set Details:*\n{description}"
-            }
-        })
+        blocks.append(_section(f"*Permission Set Details:*\n{description}"))
 
     # Add access instructions with more detailed steps
     blocks.extend([
-        {
-            "type": "divider"
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*How to Access AWS:*"
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*🌐 Web Console Access*\n1. Visit: <https://signin.aws.amazon.com/switchrole?account={account_id}|AWS Console>\n2. Sign in with your SSO credentials\n3. Select account *{account_name}* ({account_id})\n4. You should now have access with the *{permission_set}* permission set"
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*💻 AWS CLI Access*\n1. Configure AWS CLI SSO:\n```aws configure sso\nSSO start URL: https://YOUR_SSO_URL\nSSO Region: YOUR_SSO_REGION\nAccount ID: " + account_id + "\nRole name: " + permission_set + "\nCLI profile name: [choose-a-name]```\n2. Login and get credentials:\n```aws sso login```\n3. Test your access:\n```aws sts get-caller-identity```"
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*🔧 AWS SDK Configuration (Python)*\n```python\nimport boto3\nsession = boto3.Session()\ns3 = session.client('s3')\n# The session will use your SSO credentials automatically```"
-            }
-        },
+        _DIVIDER,
+        _HOW_TO_ACCESS,
+        _section(_CONSOLE_INSTRUCTIONS_FMT.format(
+            account_name=account_name, account_id=account_id, permission_set=permission_set
+        )),
+        _section(_CLI_INSTRUCTIONS_FMT.format(account_id=account_id, permission_set=permission_set)),
+        _SDK_INSTRUCTIONS,
         {
             "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"⏰ Access will expire in {duration_display}"
-                }
-            ]
+            "elements": [_mrkdwn(f"⏰ Access will expire in {duration_display}")]
         }
     ])
 
@@ -115,28 +162,9 @@ def create_access_expired_blocks(account_id: str, permission_set: str) -> Dict[s
     
     return {
         "blocks": [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "⚠️ AWS Access Expired",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"Your access to AWS account *{account_id}* with permission set *{permission_set}* has expired."
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "Need to extend your access? Use the Kubiya JIT access tool to request new credentials."
-                }
-            }
+            _EXPIRED_HEADER,
+            _section(_EXPIRED_FMT.format(account_id=account_id, permission_set=permission_set)),
+            _EXTEND_ACCESS
         ]
     }
 
@@ -145,28 +173,9 @@ def create_access_revoked_blocks(account_id: str, permission_set: str, user_emai
     
     return {
         "blocks": [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🔒 AWS Access Revoked",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"Your access to AWS account *{account_id}* with permission set *{permission_set}* has been revoked."
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "If you believe this is a mistake, please contact the security team."
-                }
-            }
+            _REVOKED_HEADER,
+            _section(_REVOKED_FMT.format(account_id=account_id, permission_set=permission_set)),
+            _CONTACT_SECURITY
         ]
     }
 
@@ -179,44 +188,18 @@ def create_s3_access_granted_blocks(account_id: str, user_email: str,
 
     return {
         "blocks": [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🎉 S3 Access Granted! 🎉",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"You've been granted *{policy_template}* access to S3 bucket *{bucket_name}*."
-                }
-            },
+            _S3_GRANTED_HEADER,
+            _section(_S3_GRANTED_FMT.format(policy_template=policy_template, bucket_name=bucket_name)),
             {
                 "type": "section",
                 "fields": [
-                    {"type": "mrkdwn", "text": f"*Duration:*\n{duration_hours:.1f} hours"},
-                    {"type": "mrkdwn", "text": f"*User:*\n{user_email}"}
+                    _mrkdwn(f"*Duration:*\n{duration_hours:.1f} hours"),
+                    _mrkdwn(f"*User:*\n{user_email}")
                 ]
             },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*How to Access the S3 Bucket:*\nYou can use your AWS credentials to access the bucket via AWS CLI, SDKs, or the AWS Console."
-                }
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {"type": "mrkdwn", "text": "⚠️ Remember to adhere to data security policies while accessing S3 resources."}
-                ]
-            }
+            _DIVIDER,
+            _S3_HOW_TO_ACCESS,
+            _S3_SECURITY_REMINDER
         ]
     }
 
@@ -225,27 +208,8 @@ def create_s3_access_revoked_blocks(user_email: str, bucket_name: str) -> Dict[s
 
     return {
         "blocks": [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🔒 S3 Access Revoked",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"Your access to S3 bucket *{bucket_name}* has been revoked."
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "If you believe this is a mistake, please contact the security team."
-                }
-            }
+            _S3_REVOKED_HEADER,
+            _section(_S3_REVOKED_FMT.format(bucket_name=bucket_name)),
+            _CONTACT_SECURITY
         ]
     }
@@ -1,8 +1,9 @@
 import os
 import logging
-import requests
 import json
+from concurrent.futures import Future
 from typing import Dict, Any, Optional
+from .async_webhook import post_json
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +13,7 @@ class WebhookHandler:
         if not self.webhook_url:
             logger.warning("REVOKATION_WEBHOOK_URL not set")
 
-    def send_revocation_webhook(self, 
+    def send_revocation_webhook(self,
                               user_email: str,
                               access_type: str,
                               policy_details: Dict[str, Any],
@@ -21,9 +22,36 @@ class WebhookHandler:
                               permission_set: Optional[str] = None,
                               buckets: Optional[list] = None) -> bool:
         """Send revocation webhook to Kubiya API."""
+        future = self._start_revocation_webhook(
+            user_email=user_email,
+            access_type=access_type,
+            policy_details=policy_details,
+            duration_seconds=duration_seconds,
+            account_id=account_id,
+            permission_set=permission_set,
+            buckets=buckets
+        )
+        return future is not None and self._check_response(future)
+
+    def build_revocation_request(self,
+                               user_email: str,
+                               access_type: str,
+                               policy_details: Dict[str, Any],
+                               duration_seconds: int,
+                               account_id: str,
+                               permission_set: Optional[str] = None,
+                               buckets: Optional[list] = None) -> Optional[Dict[str, Any]]:
+        """Build the revocation webhook request to send later.
+
+        The URL and body are resolved from the current environment, so a
+        request persisted now is sent unchanged by whichever process fires it.
+
+        Returns:
+            Dict with the webhook url and JSON body, or None if it can't be built
+        """
         if not self.webhook_url:
             logger.error("REVOKATION_WEBHOOK_URL not configured")
-            return False
+            return None
 
         try:
             # Determine the revoke tool name based on access type
@@ -50,20 +78,71 @@ class WebhookHandler:
                 },
                 "status": "pending_revocation"
             }
+            return {"url": self.webhook_url, "body": payload}
+
+        except Exception as e:
+            logger.error(f"Error building revocation webhook: {str(e)}")
+            return None
+
+    def post_revocation_request(self, request: Dict[str, Any]) -> Optional[Future]:
+        """Start sending a request from build_revocation_request without waiting for the response.
+
+        The outcome is logged once the request completes.
+
+        Returns:
+            Future resolving to the response status code, or to None if the
+            request failed; None if it could not be sent at all
+        """
+        future = self._post_request(request)
+        if future is None:
+            return None
+        status: Future = Future()
+        future.add_done_callback(lambda f: status.set_result(self._response_status(f)))
+        return status
+
+    def _start_revocation_webhook(self,
+                                user_email: str,
+                                access_type: str,
+                                policy_details: Dict[str, Any],
+                                duration_seconds: int,
+                                account_id: str,
+                                permission_set: Optional[str] = None,
+                                buckets: Optional[list] = None) -> Optional[Future]:
+        request = self.build_revocation_request(
+            user_email=user_email,
+            access_type=access_type,
+            policy_details=policy_details,
+            duration_seconds=duration_seconds,
+            account_id=account_id,
+            permission_set=permission_set,
+            buckets=buckets
+        )
+        return None if request is None else self._post_request(request)
 
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
+    def _post_request(self, request: Dict[str, Any]) -> Optional[Future]:
+        try:
+            return post_json(
+                request['url'],
+                request['body'],
                 headers={"Content-Type": "application/json"}
             )
+        except Exception as e:
+            logger.error(f"Error sending revocation webhook: {str(e)}")
+            return None
 
-            if response.status_code >= 400:
-                logger.error(f"Failed to send revocation webhook: {response.text}")
-                return False
-
-            logger.info("Revocation webhook sent successfully")
-            return True
+    def _check_response(self, future: Future) -> bool:
+        status = self._response_status(future)
+        return status is not None and status < 400
 
+    def _response_status(self, future: Future) -> Optional[int]:
+        try:
+            status, text = future.result()
         except Exception as e:
             logger.error(f"Error sending revocation webhook: {str(e)}")
-            return False 
\ No newline at end of file
+            return None
+
+        if status >= 400:
+            logger.error(f"Failed to send revocation webhook ({status}): {text}")
+        else:
+            logger.info("Revocation webhook sent successfully")
+        return status
@@ -34,10 +34,13 @@ def create_jit_tool(config, action):
     file_specs = [
         FileSpec(destination="/opt/scripts/access_handler.py", content=HANDLER_CODE),
         FileSpec(destination="/opt/scripts/utils/aws_utils.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'aws_utils.py').read()),
+        FileSpec(destination="/opt/scripts/utils/duration.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'duration.py').read()),
+        FileSpec(destination="/opt/scripts/utils/json_utils.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'json_utils.py').read()),
         FileSpec(destination="/opt/scripts/utils/notifications.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'notifications.py').read()),
         FileSpec(destination="/opt/scripts/utils/slack_client.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'slack_client.py').read()),
         FileSpec(destination="/opt/scripts/utils/slack_messages.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'slack_messages.py').read()),
         FileSpec(destination="/opt/scripts/utils/webhook_handler.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'webhook_handler.py').read()),
+        FileSpec(destination="/opt/scripts/utils/async_webhook.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'async_webhook.py').read()),
     ]
 
     mermaid_diagram = f"""
@@ -73,7 +76,7 @@ set -e
 echo ">> Processing request... ⏳"
 
 # Install dependencies only if not found
-python -c "import boto3, requests, jinja2, jsonschema, argparse" 2>/dev/null || pip install -q boto3 requests jinja2 jsonschema argparse > /dev/null 2>&1
+python -c "import boto3, requests, jinja2, jsonschema, argparse, aiohttp, orjson" 2>/dev/null || pip install -q boto3 requests jinja2 jsonschema argparse aiohttp orjson > /dev/null 2>&1
 
 export AWS_ACCOUNT_ID="{config['account_id']}"
 export PERMISSION_SET_NAME="{config['permission_set']}"
@@ -85,7 +88,7 @@ touch /opt/scripts/utils/__init__.py
 
 # Run access handler
 echo ">> Just a moment... ⏳"
-python /opt/scripts/access_handler.py {action} {"--user-email $KUBIYA_USER_EMAIL" if action == "grant" else "--user-email {{.user_email}}"} {"--duration {{.duration}}" if action == "grant" else "--duration PT1H"}
+cd /opt && python -m scripts.access_handler {action} {"--user-email $KUBIYA_USER_EMAIL" if action == "grant" else "--user-email {{.user_email}}"} {"--duration {{.duration}}" if action == "grant" else "--duration PT1H"}
 """,
         with_files=file_specs,
         mermaid=mermaid_diagram
@@ -111,10 +114,13 @@ def create_s3_jit_tool(config, action):
     file_specs = [
         FileSpec(destination="/opt/scripts/access_handler.py", content=HANDLER_CODE),
         FileSpec(destination="/opt/scripts/utils/aws_utils.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'aws_utils.py').read()),
+        FileSpec(destination="/opt/scripts/utils/duration.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'duration.py').read()),
+        FileSpec(destination="/opt/scripts/utils/json_utils.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'json_utils.py').read()),
         FileSpec(destination="/opt/scripts/utils/notifications.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'notifications.py').read()),
         FileSpec(destination="/opt/scripts/utils/slack_client.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'slack_client.py').read()),
         FileSpec(destination="/opt/scripts/utils/slack_messages.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'slack_messages.py').read()),
         FileSpec(destination="/opt/scripts/utils/webhook_handler.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'webhook_handler.py').read()),
+        FileSpec(destination="/opt/scripts/utils/async_webhook.py", content=open(Path(__file__).parent.parent / 'scripts' / 'utils' / 'async_webhook.py').read()),
     ]
 
     buckets_list = ", ".join(config['buckets'])
@@ -151,7 +157,7 @@ set -e
 echo ">> Processing request... ⏳"
 
 # Install dependencies
-pip install -q boto3 requests jinja2 jsonschema argparse
+pip install -q boto3 requests jinja2 jsonschema argparse aiohttp orjson
 
 # Export bucket names and policy template from config
 export BUCKETS="{','.join(config['buckets'])}"
@@ -162,9 +168,10 @@ touch /opt/scripts/__init__.py
 touch /opt/scripts/utils/__init__.py
 
 # Run access handler for each bucket in the configuration
+cd /opt
 for bucket in {' '.join(config['buckets'])}; do
     echo "Processing bucket: $bucket"
-    python /opt/scripts/access_handler.py {action} --user-email {"$KUBIYA_USER_EMAIL" if action == "grant" else "{{.user_email}}"} --bucket-name "$bucket" {"--duration {{.duration}}" if action == "grant" else ""}
+    python -m scripts.access_handler {action} --user-email {"$KUBIYA_USER_EMAIL" if action == "grant" else "{{.user_email}}"} --bucket-name "$bucket" {"--duration {{.duration}}" if action == "grant" else ""}
 done
 """,
         with_files=file_specs,
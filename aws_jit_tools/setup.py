@@ -8,6 +8,8 @@ setup(
         "kubiya-sdk",
         "boto3",
         "requests",
+        "aiohttp",
+        "orjson",
         "jinja2",
         "jsonschema"
     ],